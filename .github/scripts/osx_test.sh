@@ -5,4 +5,4 @@ export CONDA_BUILD_SYSROOT=/
 export C_INCLUDE_PATH=$C_INCLUDE_PATH:/Applications/Xcode.app/Contents//Developer/Platforms/MacOSX.platform/Developer/SDKs/MacOSX.sdk/usr/include/
 
 parcels_get_examples examples/;
-py.test -v -s --nbval-lax -k "not documentation" tests/ examples/;
+py.test -v -n auto tests/ && py.test -v -n auto --dist loadscope --nbval-lax -k "not documentation" examples/;
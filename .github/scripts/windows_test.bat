@@ -1,4 +1,4 @@
 SET PATH=%PYTHON%;%PYTHON%\\Scripts;%PATH%
 call activate parcels
 parcels_get_examples examples/;
-py.test -v -s --nbval-lax -k "not documentation" tests/ examples/;
+py.test -v -n auto tests/ && py.test -v -n auto --dist loadscope --nbval-lax -k "not documentation" examples/;
@@ -53,39 +53,51 @@ def moving_eddies_fieldset(xdim=200, ydim=350, mesh='flat'):
     dx = (lon[1] - lon[0]) * 1852 * 60 * cosd(lat.mean()) if mesh == 'spherical' else lon[1] - lon[0]
     dy = (lat[1] - lat[0]) * 1852 * 60 if mesh == 'spherical' else lat[1] - lat[0]
 
-    # Define arrays U (zonal), V (meridional), and P (sea surface height) on A-grid
-    U = np.zeros((lon.size, lat.size, time.size), dtype=np.float32)
-    V = np.zeros((lon.size, lat.size, time.size), dtype=np.float32)
-    P = np.zeros((lon.size, lat.size, time.size), dtype=np.float32)
-
-    # Some constants
-    corio_0 = 1.e-4  # Coriolis parameter
-    h0 = 1  # Max eddy height
-    sig = 0.5  # Eddy e-folding decay scale (in degrees)
-    g = 10  # Gravitational constant
+    # Define arrays U (zonal), V (meridional), and P (sea surface height) on A-grid,
+    # directly in the [time, lat, lon] layout that Parcels uses internally.
+    # All elements are written below, so they need not be initialised
+    U = np.empty((time.size, lat.size, lon.size), dtype=np.float32)
+    V = np.empty((time.size, lat.size, lon.size), dtype=np.float32)
+    P = np.empty((time.size, lat.size, lon.size), dtype=np.float32)
+
+    # Some constants, as float32 to keep all computations in the precision of the fields
+    corio_0 = np.float32(1.e-4)  # Coriolis parameter
+    h0 = np.float32(1)  # Max eddy height
+    sig = np.float32(0.5)  # Eddy e-folding decay scale (in degrees)
+    g = np.float32(10)  # Gravitational constant
     eddyspeed = 0.1  # Translational speed in m/s
-    dX = eddyspeed * 86400 / dx  # Grid cell movement of eddy max each day
-    dY = eddyspeed * 86400 / dy  # Grid cell movement of eddy max each day
-
-    [x, y] = np.mgrid[:lon.size, :lat.size]
-    for t in range(time.size):
-        hymax_1 = lat.size / 7.
-        hxmax_1 = .75 * lon.size - dX * t
-        hymax_2 = 3. * lat.size / 7. + dY * t
-        hxmax_2 = .75 * lon.size - dX * t
-
-        P[:, :, t] = h0 * np.exp(-(x-hxmax_1)**2/(sig*lon.size/4.)**2-(y-hymax_1)**2/(sig*lat.size/7.)**2)
-        P[:, :, t] += h0 * np.exp(-(x-hxmax_2)**2/(sig*lon.size/4.)**2-(y-hymax_2)**2/(sig*lat.size/7.)**2)
-
-        V[:-1, :, t] = -np.diff(P[:, :, t], axis=0) / dx / corio_0 * g
-        V[-1, :, t] = V[-2, :, t]  # Fill in the last column
-
-        U[:, :-1, t] = np.diff(P[:, :, t], axis=1) / dy / corio_0 * g
-        U[:, -1, t] = U[:, -2, t]  # Fill in the last row
+    dX = np.float32(eddyspeed * 86400 / dx)  # Grid cell movement of eddy max each day
+    dY = np.float32(eddyspeed * 86400 / dy)  # Grid cell movement of eddy max each day
+
+    # Eddy centres (in grid cells) for all time steps at once
+    t = np.arange(time.size, dtype=np.float32)[:, np.newaxis]
+    # Both eddies move westward at the same speed, so they share hxmax
+    hxmax = .75 * lon.size - dX * t
+    hymax_1 = lat.size / 7.
+    hymax_2 = 3. * lat.size / 7. + dY * t
+
+    # The Gaussian eddies are separable in x and y, so only evaluate
+    # the exponentials along each axis and take their outer product.
+    # With a common hxmax, the sum of both eddies factorises as ex * (ey_1 + ey_2)
+    x = np.arange(lon.size, dtype=np.float32)
+    y = np.arange(lat.size, dtype=np.float32)
+    ex = h0 * np.exp(-(x-hxmax)**2/(sig*lon.size/4.)**2)
+    ey_1 = np.exp(-(y-hymax_1)**2/(sig*lat.size/7.)**2)
+    ey_2 = np.exp(-(y-hymax_2)**2/(sig*lat.size/7.)**2)
+    np.multiply((ey_1 + ey_2)[..., np.newaxis], ex[:, np.newaxis, :], out=P)
+
+    # Geostrophic velocities from finite differences of P, computed in place
+    np.subtract(P[:, :, :-1], P[:, :, 1:], out=V[:, :, :-1])
+    V[:, :, :-1] *= g / (dx * corio_0)
+    V[:, :, -1] = V[:, :, -2]  # Fill in the last column
+
+    np.subtract(P[:, 1:, :], P[:, :-1, :], out=U[:, :-1, :])
+    U[:, :-1, :] *= g / (dy * corio_0)
+    U[:, -1, :] = U[:, -2, :]  # Fill in the last row
 
     data = {'U': U, 'V': V, 'P': P}
     dimensions = {'lon': lon, 'lat': lat, 'time': time}
-    return FieldSet.from_data(data, dimensions, transpose=True, mesh=mesh)
+    return FieldSet.from_data(data, dimensions, mesh=mesh)
 
 
 def moving_eddies_example(fieldset, outfile, npart=2, mode='jit', verbose=False,
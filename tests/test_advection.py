@@ -5,6 +5,7 @@ from parcels import (FieldSet, Field, ParticleSet, ScipyParticle, JITParticle, E
 import numpy as np
 import pytest
 import math
+from functools import lru_cache
 from netCDF4 import Dataset
 from datetime import timedelta as delta
 
@@ -24,44 +25,58 @@ gamma = 1/(86400. * 2.89)
 gamma_g = 1/(86400. * 28.9)
 
 
-def lon(xdim=200):
-    return np.linspace(-170, 170, xdim, dtype=np.float32)
+def read_only(arr):
+    """Protect arrays shared between module fixtures against modification"""
+    arr.setflags(write=False)
+    return arr
 
 
-@pytest.fixture(name="lon")
-def lon_fixture(xdim=200):
-    return lon(xdim=xdim)
+# Grid axes, only called while setting up the module-scoped FieldSet fixtures
+@lru_cache(maxsize=8)
+def lon(xdim=200):
+    return read_only(np.linspace(-170, 170, xdim, dtype=np.float32))
 
 
+@lru_cache(maxsize=8)
 def lat(ydim=100):
-    return np.linspace(-80, 80, ydim, dtype=np.float32)
+    return read_only(np.linspace(-80, 80, ydim, dtype=np.float32))
 
 
-@pytest.fixture(name="lat")
-def lat_fixture(ydim=100):
-    return lat(ydim=ydim)
+@lru_cache(maxsize=8)
+def depth(zdim=2):
+    return read_only(np.linspace(0, 30, zdim, dtype=np.float32))
 
 
-def depth(zdim=2):
-    return np.linspace(0, 30, zdim, dtype=np.float32)
+@pytest.fixture(scope='module')
+def zonal_fieldset_2d():
+    data = {'U': np.ones((lon().size, lat().size), dtype=np.float32),
+            'V': np.zeros((lon().size, lat().size), dtype=np.float32)}
+    dimensions = {'lon': lon(), 'lat': lat()}
+    return FieldSet.from_data(data, dimensions, mesh='spherical', transpose=True)
 
 
-@pytest.fixture(name="depth")
-def depth_fixture(zdim=2):
-    return depth(zdim=zdim)
+@pytest.fixture(scope='module')
+def zonal_fieldset_3d():
+    data = {'U': np.ones((lon().size, lat().size, depth().size), dtype=np.float32),
+            'V': np.zeros((lon().size, lat().size, depth().size), dtype=np.float32)}
+    dimensions = {'lon': lon(), 'lat': lat(), 'depth': depth()}
+    return FieldSet.from_data(data, dimensions, mesh='spherical', transpose=True)
+
+
+@pytest.fixture(scope='module')
+def meridional_fieldset():
+    data = {'U': np.zeros((lon().size, lat().size), dtype=np.float32),
+            'V': np.ones((lon().size, lat().size), dtype=np.float32)}
+    dimensions = {'lon': lon(), 'lat': lat()}
+    return FieldSet.from_data(data, dimensions, mesh='spherical', transpose=True)
 
 
 @pytest.mark.parametrize('mode', ['scipy', 'jit'])
-def test_advection_zonal(lon, lat, depth, mode, npart=10):
+def test_advection_zonal(zonal_fieldset_2d, zonal_fieldset_3d, mode, npart=10):
     """ Particles at high latitude move geographically faster due to
         the pole correction in `GeographicPolar`.
     """
-    data2D = {'U': np.ones((lon.size, lat.size), dtype=np.float32),
-              'V': np.zeros((lon.size, lat.size), dtype=np.float32)}
-    data3D = {'U': np.ones((lon.size, lat.size, depth.size), dtype=np.float32),
-              'V': np.zeros((lon.size, lat.size, depth.size), dtype=np.float32)}
-    dimensions = {'lon': lon, 'lat': lat}
-    fieldset2D = FieldSet.from_data(data2D, dimensions, mesh='spherical', transpose=True)
+    fieldset2D = zonal_fieldset_2d
     assert fieldset2D.U.creation_log == 'from_data'
 
     pset2D = ParticleSet(fieldset2D, pclass=ptype[mode],
@@ -70,8 +85,7 @@ def test_advection_zonal(lon, lat, depth, mode, npart=10):
     pset2D.execute(AdvectionRK4, runtime=delta(hours=2), dt=delta(seconds=30))
     assert (np.diff(pset2D.lon) > 1.e-4).all()
 
-    dimensions['depth'] = depth
-    fieldset3D = FieldSet.from_data(data3D, dimensions, mesh='spherical', transpose=True)
+    fieldset3D = zonal_fieldset_3d
     pset3D = ParticleSet(fieldset3D, pclass=ptype[mode],
                          lon=np.zeros(npart) + 20.,
                          lat=np.linspace(0, 80, npart),
@@ -81,14 +95,11 @@ def test_advection_zonal(lon, lat, depth, mode, npart=10):
 
 
 @pytest.mark.parametrize('mode', ['scipy', 'jit'])
-def test_advection_meridional(lon, lat, mode, npart=10):
+def test_advection_meridional(meridional_fieldset, mode, npart=10):
     """ Particles at high latitude move geographically faster due to
         the pole correction in `GeographicPolar`.
     """
-    data = {'U': np.zeros((lon.size, lat.size), dtype=np.float32),
-            'V': np.ones((lon.size, lat.size), dtype=np.float32)}
-    dimensions = {'lon': lon, 'lat': lat}
-    fieldset = FieldSet.from_data(data, dimensions, mesh='spherical', transpose=True)
+    fieldset = meridional_fieldset
 
     pset = ParticleSet(fieldset, pclass=ptype[mode],
                        lon=np.linspace(-60, 60, npart),
@@ -129,9 +140,9 @@ def test_advection_3D_outofbounds(mode, direction, wErrorThroughSurface):
                   'lat': np.linspace(0., 1, ydim, dtype=np.float32),
                   'depth': np.linspace(0., 1, zdim, dtype=np.float32)}
     wfac = -1. if direction == 'up' else 1.
-    data = {'U': 0.01*np.ones((xdim, ydim, zdim), dtype=np.float32),
+    data = {'U': np.full((xdim, ydim, zdim), 0.01, dtype=np.float32),
             'V': np.zeros((xdim, ydim, zdim), dtype=np.float32),
-            'W': wfac * np.ones((xdim, ydim, zdim), dtype=np.float32)}
+            'W': np.full((xdim, ydim, zdim), wfac, dtype=np.float32)}
     fieldset = FieldSet.from_data(data, dimensions, mesh='flat')
 
     def DeleteParticle(particle, fieldset, time):
@@ -161,21 +172,34 @@ def periodicfields(xdim, ydim, uvel, vvel):
     dimensions = {'lon': np.linspace(0., 1., xdim+1, dtype=np.float32)[1:],  # don't include both 0 and 1, for periodic b.c.
                   'lat': np.linspace(0., 1., ydim+1, dtype=np.float32)[1:]}
 
-    data = {'U': uvel * np.ones((xdim, ydim), dtype=np.float32),
-            'V': vvel * np.ones((xdim, ydim), dtype=np.float32)}
+    data = {'U': np.full((xdim, ydim), uvel, dtype=np.float32),
+            'V': np.full((xdim, ydim), vvel, dtype=np.float32)}
     return FieldSet.from_data(data, dimensions, mesh='spherical', transpose=True)
 
 
 def periodicBC(particle, fieldset, time):
-    particle.lon = math.fmod(particle.lon, 1)
-    particle.lat = math.fmod(particle.lat, 1)
+    particle.lon = particle.lon - math.floor(particle.lon)
+    particle.lat = particle.lat - math.floor(particle.lat)
+
+
+# Grid and halo sizes shared between the periodic_fieldset fixture and the tests' asserts
+periodic_xdim = periodic_ydim = 100
+periodic_halosize = 3
+
+
+@pytest.fixture(scope='module')
+def periodic_fieldset(request):
+    uvel, vvel, halo = request.param
+    fieldset = periodicfields(periodic_xdim, periodic_ydim, uvel=uvel, vvel=vvel)
+    fieldset.add_periodic_halo(**halo)
+    return fieldset
 
 
 @pytest.mark.parametrize('mode', ['scipy', 'jit'])
-def test_advection_periodic_zonal(mode, xdim=100, ydim=100, halosize=3):
-    fieldset = periodicfields(xdim, ydim, uvel=1., vvel=0.)
-    fieldset.add_periodic_halo(zonal=True, halosize=halosize)
-    assert(len(fieldset.U.lon) == xdim + 2 * halosize)
+@pytest.mark.parametrize('periodic_fieldset', [(1., 0., {'zonal': True, 'halosize': periodic_halosize})], indirect=True)
+def test_advection_periodic_zonal(periodic_fieldset, mode):
+    fieldset = periodic_fieldset
+    assert(len(fieldset.U.lon) == periodic_xdim + 2 * periodic_halosize)
 
     pset = ParticleSet(fieldset, pclass=ptype[mode], lon=[0.5], lat=[0.5])
     pset.execute(AdvectionRK4 + pset.Kernel(periodicBC), runtime=delta(hours=20), dt=delta(seconds=30))
@@ -183,10 +207,10 @@ def test_advection_periodic_zonal(mode, xdim=100, ydim=100, halosize=3):
 
 
 @pytest.mark.parametrize('mode', ['scipy', 'jit'])
-def test_advection_periodic_meridional(mode, xdim=100, ydim=100):
-    fieldset = periodicfields(xdim, ydim, uvel=0., vvel=1.)
-    fieldset.add_periodic_halo(meridional=True)
-    assert(len(fieldset.U.lat) == ydim + 10)  # default halo size is 5 grid points
+@pytest.mark.parametrize('periodic_fieldset', [(0., 1., {'meridional': True})], indirect=True)
+def test_advection_periodic_meridional(periodic_fieldset, mode):
+    fieldset = periodic_fieldset
+    assert(len(fieldset.U.lat) == periodic_ydim + 10)  # default halo size is 5 grid points
 
     pset = ParticleSet(fieldset, pclass=ptype[mode], lon=[0.5], lat=[0.5])
     pset.execute(AdvectionRK4 + pset.Kernel(periodicBC), runtime=delta(hours=20), dt=delta(seconds=30))
@@ -194,11 +218,11 @@ def test_advection_periodic_meridional(mode, xdim=100, ydim=100):
 
 
 @pytest.mark.parametrize('mode', ['scipy', 'jit'])
-def test_advection_periodic_zonal_meridional(mode, xdim=100, ydim=100):
-    fieldset = periodicfields(xdim, ydim, uvel=1., vvel=1.)
-    fieldset.add_periodic_halo(zonal=True, meridional=True)
-    assert(len(fieldset.U.lat) == ydim + 10)  # default halo size is 5 grid points
-    assert(len(fieldset.U.lon) == xdim + 10)  # default halo size is 5 grid points
+@pytest.mark.parametrize('periodic_fieldset', [(1., 1., {'zonal': True, 'meridional': True})], indirect=True)
+def test_advection_periodic_zonal_meridional(periodic_fieldset, mode):
+    fieldset = periodic_fieldset
+    assert(len(fieldset.U.lat) == periodic_ydim + 10)  # default halo size is 5 grid points
+    assert(len(fieldset.U.lon) == periodic_xdim + 10)  # default halo size is 5 grid points
     assert np.allclose(np.diff(fieldset.U.lat), fieldset.U.lat[1]-fieldset.U.lat[0], rtol=0.001)
     assert np.allclose(np.diff(fieldset.U.lon), fieldset.U.lon[1]-fieldset.U.lon[0], rtol=0.001)
 
@@ -208,6 +232,10 @@ def test_advection_periodic_zonal_meridional(mode, xdim=100, ydim=100):
     assert abs(pset.lat[0] - 0.15) < 0.1
 
 
+# Per-process cache, so safe to use when distributing tests with pytest-xdist
+_length1dimensions_fieldsets = {}
+
+
 @pytest.mark.parametrize('mode', ['scipy', 'jit'])
 @pytest.mark.parametrize('u', [-0.3, np.array(0.2)])
 @pytest.mark.parametrize('v', [0.2, np.array(1)])
@@ -216,27 +244,32 @@ def test_length1dimensions(mode, u, v, w):
     (lon, xdim) = (np.linspace(-10, 10, 21), 21) if isinstance(u, np.ndarray) else (0, 1)
     (lat, ydim) = (np.linspace(-15, 15, 31), 31) if isinstance(v, np.ndarray) else (-4, 1)
     (depth, zdim) = (np.linspace(-5, 5, 11), 11) if (isinstance(w, np.ndarray) and w is not None) else (3, 1)
-    dimensions = {'lon': lon, 'lat': lat, 'depth': depth}
-
-    dims = []
-    if zdim > 1:
-        dims.append(zdim)
-    if ydim > 1:
-        dims.append(ydim)
-    if xdim > 1:
-        dims.append(xdim)
-    if len(dims) > 0:
-        U = u * np.ones(dims, dtype=np.float32)
-        V = v * np.ones(dims, dtype=np.float32)
-        if w is not None:
-            W = w * np.ones(dims, dtype=np.float32)
-    else:
-        U, V, W = u, v, w
 
-    data = {'U': U, 'V': V}
-    if w is not None:
-        data['W'] = W
-    fieldset = FieldSet.from_data(data, dimensions, mesh='flat')
+    # the dimensions uniquely determine u, v and w, so FieldSets can be shared between modes
+    key = (xdim, ydim, zdim, w is not None)
+    if key not in _length1dimensions_fieldsets:
+        dimensions = {'lon': lon, 'lat': lat, 'depth': depth}
+
+        dims = []
+        if zdim > 1:
+            dims.append(zdim)
+        if ydim > 1:
+            dims.append(ydim)
+        if xdim > 1:
+            dims.append(xdim)
+        if len(dims) > 0:
+            U = np.full(dims, u, dtype=np.float32)
+            V = np.full(dims, v, dtype=np.float32)
+            if w is not None:
+                W = np.full(dims, w, dtype=np.float32)
+        else:
+            U, V, W = u, v, w
+
+        data = {'U': U, 'V': V}
+        if w is not None:
+            data['W'] = W
+        _length1dimensions_fieldsets[key] = FieldSet.from_data(data, dimensions, mesh='flat')
+    fieldset = _length1dimensions_fieldsets[key]
 
     x0, y0, z0 = 2, 8, -4
     pset = ParticleSet(fieldset, pclass=ptype[mode], lon=x0, lat=y0, depth=z0)
@@ -249,9 +282,14 @@ def test_length1dimensions(mode, u, v, w):
         assert np.abs(pset.depth - z0 - 4 * w) < 1e-6
 
 
+def uniform_in_space(timeseries, xdim, ydim):
+    """Broadcast a time series to a spatially uniform (xdim, ydim, time) array"""
+    return np.broadcast_to(timeseries.astype(np.float32), (xdim, ydim, timeseries.size)).copy()
+
+
 def truth_stationary(x_0, y_0, t):
-    lat = y_0 - u_0 / f * (1 - math.cos(f * t))
-    lon = x_0 + u_0 / f * math.sin(f * t)
+    lat = y_0 - u_0 / f * (1 - np.cos(f * t))
+    lon = x_0 + u_0 / f * np.sin(f * t)
     return lon, lat
 
 
@@ -266,8 +304,9 @@ def fieldset_stationary(xdim=100, ydim=100, maxtime=delta(hours=6)):
     dimensions = {'lon': np.linspace(0, 25000, xdim, dtype=np.float32),
                   'lat': np.linspace(0, 25000, ydim, dtype=np.float32),
                   'time': time}
-    data = {'U': np.ones((xdim, ydim, 1), dtype=np.float32) * u_0 * np.cos(f * time),
-            'V': np.ones((xdim, ydim, 1), dtype=np.float32) * -u_0 * np.sin(f * time)}
+    ct, st = np.cos(f * time), np.sin(f * time)
+    data = {'U': uniform_in_space(u_0 * ct, xdim, ydim),
+            'V': uniform_in_space(-u_0 * st, xdim, ydim)}
     return FieldSet.from_data(data, dimensions, mesh='flat', transpose=True)
 
 
@@ -291,8 +330,7 @@ def test_stationary_eddy(fieldset_stationary, mode, method, rtol, diffField, npa
     pset = ParticleSet(fieldset, pclass=ptype[mode], lon=lon, lat=lat)
     endtime = delta(hours=6).total_seconds()
     pset.execute(kernel[method], dt=delta(minutes=3), endtime=endtime)
-    exp_lon = [truth_stationary(x, y, endtime)[0] for x, y, in zip(lon, lat)]
-    exp_lat = [truth_stationary(x, y, endtime)[1] for x, y, in zip(lon, lat)]
+    exp_lon, exp_lat = truth_stationary(lon, lat, endtime)
     assert np.allclose(pset.lon, exp_lon, rtol=rtol)
     assert np.allclose(pset.lat, exp_lat, rtol=rtol)
 
@@ -308,9 +346,9 @@ def test_stationary_eddy_vertical(mode, npart=1):
     lon_data = np.linspace(0, 25000, xdim, dtype=np.float32)
     lat_data = np.linspace(0, 25000, ydim, dtype=np.float32)
     time_data = np.arange(0., 6*3600+1e-5, 60., dtype=np.float64)
-    fld1 = np.ones((xdim, ydim, 1), dtype=np.float32) * u_0 * np.cos(f * time_data)
-    fld2 = np.ones((xdim, ydim, 1), dtype=np.float32) * -u_0 * np.sin(f * time_data)
-    fldzero = np.zeros((xdim, ydim, 1), dtype=np.float32) * time_data
+    fld1 = uniform_in_space(u_0 * np.cos(f * time_data), xdim, ydim)
+    fld2 = uniform_in_space(-u_0 * np.sin(f * time_data), xdim, ydim)
+    fldzero = np.zeros((xdim, ydim, time_data.size), dtype=np.float32)
 
     dimensions = {'lon': lon_data, 'lat': lat_data, 'time': time_data}
     data = {'U': fld1, 'V': fldzero, 'W': fld2}
@@ -319,8 +357,7 @@ def test_stationary_eddy_vertical(mode, npart=1):
     pset = ParticleSet(fieldset, pclass=ptype[mode], lon=lon,
                        lat=lat, depth=depth)
     pset.execute(AdvectionRK4_3D, dt=delta(minutes=3), endtime=endtime)
-    exp_lon = [truth_stationary(x, z, endtime)[0] for x, z, in zip(lon, depth)]
-    exp_depth = [truth_stationary(x, z, endtime)[1] for x, z, in zip(lon, depth)]
+    exp_lon, exp_depth = truth_stationary(lon, depth, endtime)
     assert np.allclose(pset.lon, exp_lon, rtol=1e-5)
     assert np.allclose(pset.lat, lat, rtol=1e-5)
     assert np.allclose(pset.depth, exp_depth, rtol=1e-5)
@@ -331,16 +368,15 @@ def test_stationary_eddy_vertical(mode, npart=1):
     pset = ParticleSet(fieldset, pclass=ptype[mode], lon=lon,
                        lat=lat, depth=depth)
     pset.execute(AdvectionRK4_3D, dt=delta(minutes=3), endtime=endtime)
-    exp_depth = [truth_stationary(z, y, endtime)[0] for z, y, in zip(depth, lat)]
-    exp_lat = [truth_stationary(z, y, endtime)[1] for z, y, in zip(depth, lat)]
+    exp_depth, exp_lat = truth_stationary(depth, lat, endtime)
     assert np.allclose(pset.lon, lon, rtol=1e-5)
     assert np.allclose(pset.lat, exp_lat, rtol=1e-5)
     assert np.allclose(pset.depth, exp_depth, rtol=1e-5)
 
 
 def truth_moving(x_0, y_0, t):
-    lat = y_0 - (u_0 - u_g) / f * (1 - math.cos(f * t))
-    lon = x_0 + u_g * t + (u_0 - u_g) / f * math.sin(f * t)
+    lat = y_0 - (u_0 - u_g) / f * (1 - np.cos(f * t))
+    lon = x_0 + u_g * t + (u_0 - u_g) / f * np.sin(f * t)
     return lon, lat
 
 
@@ -355,8 +391,9 @@ def fieldset_moving(xdim=100, ydim=100, maxtime=delta(hours=6)):
     dimensions = {'lon': np.linspace(0, 25000, xdim, dtype=np.float32),
                   'lat': np.linspace(0, 25000, ydim, dtype=np.float32),
                   'time': time}
-    data = {'U': np.ones((xdim, ydim, 1), dtype=np.float32) * u_g + (u_0 - u_g) * np.cos(f * time),
-            'V': np.ones((xdim, ydim, 1), dtype=np.float32) * -(u_0 - u_g) * np.sin(f * time)}
+    ct, st = np.cos(f * time), np.sin(f * time)
+    data = {'U': uniform_in_space(u_g + (u_0 - u_g) * ct, xdim, ydim),
+            'V': uniform_in_space(-(u_0 - u_g) * st, xdim, ydim)}
     return FieldSet.from_data(data, dimensions, mesh='flat', transpose=True)
 
 
@@ -380,8 +417,7 @@ def test_moving_eddy(fieldset_moving, mode, method, rtol, diffField, npart=1):
     pset = ParticleSet(fieldset, pclass=ptype[mode], lon=lon, lat=lat)
     endtime = delta(hours=6).total_seconds()
     pset.execute(kernel[method], dt=delta(minutes=3), endtime=endtime)
-    exp_lon = [truth_moving(x, y, endtime)[0] for x, y, in zip(lon, lat)]
-    exp_lat = [truth_moving(x, y, endtime)[1] for x, y, in zip(lon, lat)]
+    exp_lon, exp_lat = truth_moving(lon, lat, endtime)
     assert np.allclose(pset.lon, exp_lon, rtol=rtol)
     assert np.allclose(pset.lat, exp_lat, rtol=rtol)
 
@@ -392,7 +428,7 @@ def truth_decaying(x_0, y_0, t):
     lon = x_0 + (u_g / gamma_g * (1 - np.exp(-gamma_g * t))
                  + (u_0 - u_g) * f / (f ** 2 + gamma ** 2)
                  * (gamma / f + np.exp(-gamma * t)
-                    * (math.sin(f * t) - gamma / f * math.cos(f * t))))
+                    * (np.sin(f * t) - gamma / f * np.cos(f * t))))
     return lon, lat
 
 
@@ -407,8 +443,10 @@ def fieldset_decaying(xdim=100, ydim=100, maxtime=delta(hours=6)):
     dimensions = {'lon': np.linspace(0, 25000, xdim, dtype=np.float32),
                   'lat': np.linspace(0, 25000, ydim, dtype=np.float32),
                   'time': time}
-    data = {'U': np.ones((xdim, ydim, 1), dtype=np.float32) * u_g * np.exp(-gamma_g * time) + (u_0 - u_g) * np.exp(-gamma * time) * np.cos(f * time),
-            'V': np.ones((xdim, ydim, 1), dtype=np.float32) * -(u_0 - u_g) * np.exp(-gamma * time) * np.sin(f * time)}
+    ct, st = np.cos(f * time), np.sin(f * time)
+    eg, egg = np.exp(-gamma * time), np.exp(-gamma_g * time)
+    data = {'U': uniform_in_space(u_g * egg + (u_0 - u_g) * eg * ct, xdim, ydim),
+            'V': uniform_in_space(-(u_0 - u_g) * eg * st, xdim, ydim)}
     return FieldSet.from_data(data, dimensions, mesh='flat', transpose=True)
 
 
@@ -432,8 +470,7 @@ def test_decaying_eddy(fieldset_decaying, mode, method, rtol, diffField, npart=1
     pset = ParticleSet(fieldset, pclass=ptype[mode], lon=lon, lat=lat)
     endtime = delta(hours=6).total_seconds()
     pset.execute(kernel[method], dt=delta(minutes=3), endtime=endtime)
-    exp_lon = [truth_decaying(x, y, endtime)[0] for x, y, in zip(lon, lat)]
-    exp_lat = [truth_decaying(x, y, endtime)[1] for x, y, in zip(lon, lat)]
+    exp_lon, exp_lat = truth_decaying(lon, lat, endtime)
     assert np.allclose(pset.lon, exp_lon, rtol=rtol)
     assert np.allclose(pset.lat, exp_lat, rtol=rtol)
 
@@ -464,14 +501,14 @@ def test_uniform_analytical(mode, u, v, w, direction, tmpdir):
     lat = np.arange(0, 15, dtype=np.float32)
     if w is not None:
         depth = np.arange(0, 40, 2, dtype=np.float32)
-        U = u * np.ones((depth.size, lat.size, lon.size), dtype=np.float32)
-        V = v * np.ones((depth.size, lat.size, lon.size), dtype=np.float32)
-        W = w * np.ones((depth.size, lat.size, lon.size), dtype=np.float32)
+        U = np.full((depth.size, lat.size, lon.size), u, dtype=np.float32)
+        V = np.full((depth.size, lat.size, lon.size), v, dtype=np.float32)
+        W = np.full((depth.size, lat.size, lon.size), w, dtype=np.float32)
         fieldset = FieldSet.from_data({'U': U, 'V': V, 'W': W}, {'lon': lon, 'lat': lat, 'depth': depth}, mesh='flat')
         fieldset.W.interp_method = 'cgrid_velocity'
     else:
-        U = u * np.ones((lat.size, lon.size), dtype=np.float32)
-        V = v * np.ones((lat.size, lon.size), dtype=np.float32)
+        U = np.full((lat.size, lon.size), u, dtype=np.float32)
+        V = np.full((lat.size, lon.size), v, dtype=np.float32)
         fieldset = FieldSet.from_data({'U': U, 'V': V}, {'lon': lon, 'lat': lat}, mesh='flat')
     fieldset.U.interp_method = 'cgrid_velocity'
     fieldset.V.interp_method = 'cgrid_velocity'
@@ -487,7 +524,8 @@ def test_uniform_analytical(mode, u, v, w, direction, tmpdir):
     if w:
         assert np.abs(pset.depth - z0 - 4 * w * direction) < 1e-4
 
-    time = Dataset(outfile, 'r', 'NETCDF4').variables['time'][:]
+    with Dataset(outfile, 'r', 'NETCDF4') as ds:
+        time = ds.variables['time'][:]
+        lons = ds.variables['lon'][:]
     assert np.allclose(time, direction*np.arange(0, 5))
-    lons = Dataset(outfile, 'r', 'NETCDF4').variables['lon'][:]
     assert np.allclose(lons, x0+direction*u*np.arange(0, 5))